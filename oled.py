@@ -4,14 +4,31 @@
 import os
 import platform
 import datetime
+import operator
+import threading
 import time
 import requests
 import json
+from collections import namedtuple
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from PIL import Image, ImageDraw, ImageFont
+try:
+    # C JSON decoder, noticeably faster on the Pi; optional
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: vectorizes the 4-bit pixel packing for the panel
+    import numpy as np
+except ImportError:
+    np = None
+
+from PIL import Image, ImageDraw, ImageFont, ImageChops
 
 device = None
+is_real_oled = False
 
 def running_on_pi() -> bool:
     """Rough check: Raspberry Pi is Linux + ARM."""
@@ -36,6 +53,7 @@ if running_on_pi() and spi is not None and ssd1322 is not None:
     try:
         serial = spi(device=0, port=0, gpio_DC=24, gpio_RST=25)
         device = ssd1322(serial)
+        is_real_oled = True
         print("Using real SSD1322 on Raspberry Pi")
     except Exception as e:
         print("Failed to init real SSD1322, will try emulator:", e)
@@ -75,6 +93,44 @@ except Exception as e:
         FONT = None
         FONT_ICON = None
 
+# ----------------------------
+#   Cached text tiles
+# ----------------------------
+
+# Pillow re-runs FreeType layout + rasterization on every draw.text
+# call, even for strings that repeat every frame (line numbers, "Nm"
+# minutes, destinations). Render each unique (text, font) pair once
+# into a small greyscale tile and paste the cached copy thereafter.
+
+FONT_MAIN = 0
+FONT_BIG = 1
+_TILE_FONTS = {FONT_MAIN: FONT, FONT_BIG: FONT_ICON}
+
+@lru_cache(maxsize=512)
+def render_tile(text, font_id):
+    """Render text once into a greyscale tile used as its own paste mask."""
+    font = _TILE_FONTS[font_id]
+    bbox = font.getbbox(text)
+    tile = Image.new("L", (max(bbox[2], 1), max(bbox[3], 1)))
+    ImageDraw.Draw(tile).text((0, 0), text, fill=255, font=font)
+    return tile
+
+def paste_text(image, xy, text, font_id=FONT_MAIN):
+    """Drop-in replacement for draw.text that hits the tile cache."""
+    image.paste(255, xy, render_tile(text, font_id))
+
+# Every plausible minutes label, built (and its tile pre-rendered)
+# once at startup so the render loop never formats or rasterizes one
+MIN_LABELS = [f"{n:>2}m" for n in range(100)]
+if FONT is not None:
+    for _label in MIN_LABELS:
+        render_tile(_label, FONT_MAIN)
+    del _label
+
+def min_label(mins):
+    """Minutes-until-arrival label, from the precomputed table when possible."""
+    return MIN_LABELS[mins] if 0 <= mins < 100 else f"{mins:>2}m"
+
 # ----------------------------
 #   Entur API setup
 # ----------------------------
@@ -110,73 +166,197 @@ HEADERS = {
     "ET-Client-Name": config.get("api", {}).get("clientName", "fluted-departureboard")
 }
 
-def fetch_departures(stop_id):
+# One session for the life of the process so urllib3 keeps the TLS
+# connection to api.entur.io alive between refreshes.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# TTL cache for fetch_all_departures, keyed on the stop ids. Fresh
+# entries short-circuit the HTTP call entirely; expired entries stick
+# around as a stale fallback so a network blip or API hiccup degrades
+# to a slightly old board instead of a blank one.
+_fetch_cache = {}
+
+# Batched query strings, built once per stop set and reused verbatim
+_query_cache = {}
+
+def fetch_all_departures(stops):
+    """Fetch departures for every stop in one batched GraphQL request.
+
+    Each stop becomes an aliased stopPlace field (s0, s1, ...) so the
+    whole refresh costs a single HTTP round-trip instead of one per stop.
+    Returns a list of (stop_name, calls) tuples, one per stop, in order.
+    Results are cached for the configured refresh interval; on failure
+    the last good result is served instead of an error placeholder.
+    """
+    cache_key = tuple(stop["id"] for stop in stops)
+    ttl = config.get("settings", {}).get("refreshInterval", 30000) / 1000.0
+    cached = _fetch_cache.get(cache_key)
+    if cached is not None and time.time() < cached[0]:
+        return cached[1]
+
     num_departures = config.get("settings", {}).get("numberOfDepartures", 3)
-    query = f"""
-    {{
-        stopPlace(id: "{stop_id}") {{
+
+    # Build the query once per stop set and reuse the identical string
+    # afterwards; the departure count travels as a GraphQL variable so
+    # the server sees the same operation every refresh and can hit its
+    # query-plan cache. The stop ids stay inline because each one is a
+    # distinct alias.
+    query = _query_cache.get(cache_key)
+    if query is None:
+        fields = []
+        for i, stop in enumerate(stops):
+            fields.append(f"""
+        s{i}: stopPlace(id: "{stop["id"]}") {{
             name
-            estimatedCalls(numberOfDepartures: {num_departures}) {{
+            estimatedCalls(numberOfDepartures: $n) {{
                 expectedArrivalTime
                 aimedArrivalTime
                 realtime
                 destinationDisplay {{ frontText }}
                 serviceJourney {{ line {{ publicCode transportMode }} }}
             }}
-        }}
-    }}
-    """
+        }}""")
+        query = "query($n: Int!) {" + "".join(fields) + "\n    }"
+        _query_cache[cache_key] = query
 
     try:
-        r = requests.post(URL, headers=HEADERS, json={"query": query}, timeout=10)
+        r = SESSION.post(URL, json={"query": query, "variables": {"n": num_departures}}, timeout=10)
         r.raise_for_status()
-        data = r.json()
-        
+        data = orjson.loads(r.content) if orjson is not None else r.json()
+
         # Check for GraphQL errors
         if "errors" in data:
-            print(f"GraphQL error for {stop_id}: {data['errors']}")
-            return ("Error", [])
-        
-        stop_place = data["data"]["stopPlace"]
-        if stop_place is None:
-            print(f"Stop {stop_id} not found in API")
-            return ("Not Found", [])
-        
-        stop_name = stop_place.get("name", "Unknown Stop")
-        calls = stop_place["estimatedCalls"]
-        # Filter out any entries without an expectedArrivalTime
-        filtered_calls = [c for c in calls if c.get("expectedArrivalTime")]
-        return (stop_name, filtered_calls)
+            print(f"GraphQL error: {data['errors']}")
+            if cached is not None:
+                print("Serving stale departures from cache")
+                return cached[1]
+            return [("Error", []) for _ in stops]
+
+        results = []
+        for i, stop in enumerate(stops):
+            stop_place = data["data"].get(f"s{i}")
+            if stop_place is None:
+                print(f"Stop {stop['id']} not found in API")
+                results.append(("Not Found", []))
+                continue
+
+            stop_name = stop_place.get("name", "Unknown Stop")
+            calls = stop_place["estimatedCalls"]
+            # Filter out any entries without an expectedArrivalTime
+            filtered_calls = [c for c in calls if c.get("expectedArrivalTime")]
+            results.append((stop_name, filtered_calls))
+        _fetch_cache[cache_key] = (time.time() + ttl, results)
+        return results
     except Exception as e:
-        print(f"Error fetching departures for {stop_id}: {type(e).__name__}: {e}")
+        print(f"Error fetching departures: {type(e).__name__}: {e}")
         import traceback
         traceback.print_exc()
-        return ("Error", [])
+        if cached is not None:
+            print("Serving stale departures from cache")
+            return cached[1]
+        return [("Error", []) for _ in stops]
+
+# ----------------------------
+#   Time parsing
+# ----------------------------
+
+# Entur timestamps all share the fixed shape "YYYY-MM-DDTHH:MM:SS+HH:MM"
+# (sometimes with a trailing "Z"). Slicing the digits out directly is
+# far cheaper than datetime.fromisoformat, which dominates per-frame
+# CPU time on the Pi. The midnight epoch per date is cached since every
+# timestamp in a refresh shares one or two dates.
+
+_midnight_epochs = {}
+
+def parse_iso_epoch(ts):
+    """Parse an Entur ISO-8601 timestamp straight to a UTC epoch (seconds)."""
+    try:
+        day = ts[:10]
+        midnight = _midnight_epochs.get(day)
+        if midnight is None:
+            midnight = datetime.datetime(
+                int(day[:4]), int(day[5:7]), int(day[8:10]),
+                tzinfo=datetime.timezone.utc,
+            ).timestamp()
+            _midnight_epochs[day] = midnight
+        secs = int(ts[11:13]) * 3600 + int(ts[14:16]) * 60 + int(ts[17:19])
+        tail = ts[19:]
+        if not tail or tail == "Z":
+            offset = 0
+        elif tail[0] in "+-":
+            offset = int(tail[1:3]) * 3600 + int(tail[-2:]) * 60
+            if tail[0] == "-":
+                offset = -offset
+        else:
+            raise ValueError(tail)
+        return midnight + secs - offset
+    except (ValueError, IndexError):
+        # Unexpected shape (e.g. fractional seconds) - take the slow path
+        return datetime.datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
 
 # ----------------------------
 #   Drawing and main loop
 # ----------------------------
 
+# The SSD1322 is a greyscale panel, so on real hardware the working
+# buffer can be 1-bit: a third of the bytes of RGB for every clear,
+# copy and paste, and a trivial downsample inside luma (its preprocess
+# converts to the device mode either way). The emulator window keeps
+# its native RGB mode.
+DRAW_MODE = "1" if is_real_oled else device.mode
+
+# Pre-rendered base canvas: built once, copied at the start of every
+# frame instead of allocating and clearing a fresh Image each tick.
+# Anything static (the blank background today) lives here; per-frame
+# code only draws the dynamic text on top.
+TEMPLATE_IMG = Image.new(DRAW_MODE, device.size)
+_template_draw = ImageDraw.Draw(TEMPLATE_IMG)
+_template_draw.rectangle((0, 0, device.width - 1, device.height - 1), fill=0)
+del _template_draw
+
+# Right-aligned X for the header clock: "HH:MM:SS" always lays out to
+# the same width, so measure it once instead of calling textbbox every
+# frame (getlength skips the full layout pass)
+try:
+    TIME_X = device.width - int(FONT.getlength("00:00:00")) - 5  # 5 px from right edge
+except Exception:
+    TIME_X = device.width - 60
+
+# Flat per-departure row built once at ingestion, so the render loop
+# reads attributes instead of chasing the nested GraphQL dicts every
+# frame
+DepRow = namedtuple("DepRow", "line dest symbol realtime epoch_aim epoch_exp")
+
 def get_all_departures(tz, now_utc):
-    """Fetch departures for all configured stops and return (deps, stop_infos)."""
+    """Fetch departures for all configured stops and return (deps, stop_infos).
+
+    deps is a list of DepRow tuples sorted by expected arrival.
+    """
     stops = config.get("stops", [])
     deps = []
     stop_infos = []
-    for stop in stops:
-        stop_name, calls = fetch_departures(stop["id"])
+    for stop_name, calls in fetch_all_departures(stops):
         if stop_name in ("Not Found", "Error"):
             continue
 
+        # Parse each timestamp exactly once at ingestion; everything
+        # downstream (sorting, delay checks, minute maths) reads the
+        # annotated epochs instead of re-parsing the ISO strings
+        for c in calls:
+            c["_epoch_exp"] = parse_iso_epoch(c["expectedArrivalTime"])
+            aimed = c.get("aimedArrivalTime")
+            c["_epoch_aim"] = parse_iso_epoch(aimed) if aimed else None
+
         # Determine next arrival for this stop
         next_info = ""
         try:
             if calls:
-                earliest = min(c["expectedArrivalTime"] for c in calls if c.get("expectedArrivalTime"))
-                t_exp = datetime.datetime.fromisoformat(earliest.replace("Z", "+00:00")).astimezone(datetime.timezone.utc)
-                mins = max(int((t_exp - now_utc).total_seconds() / 60), 0)
+                epoch_exp = min(c["_epoch_exp"] for c in calls)
+                mins = max(int((epoch_exp - now_utc.timestamp()) / 60), 0)
                 try:
-                    t_local = datetime.datetime.fromisoformat(earliest.replace("Z", "+00:00")).astimezone(tz)
-                    time_str = t_local.strftime("%H:%M")
+                    time_str = datetime.datetime.fromtimestamp(epoch_exp, tz).strftime("%H:%M")
                 except Exception:
                     time_str = "--:--"
                 next_info = f"{mins}m {time_str}"
@@ -188,114 +368,197 @@ def get_all_departures(tz, now_utc):
         else:
             stop_infos.append(stop_name)
 
-        deps.extend(calls)
+        for c in calls:
+            line_info = c["serviceJourney"]["line"]
+            mode_norm = (line_info.get("transportMode") or "").lower()
+            deps.append(DepRow(
+                line=line_info["publicCode"],
+                dest=c.get("destinationDisplay", {}).get("frontText", ""),
+                symbol="🚊" if mode_norm == "tram" else "🚌",
+                realtime=c.get("realtime", False),
+                epoch_aim=c["_epoch_aim"],
+                epoch_exp=c["_epoch_exp"],
+            ))
 
     try:
-        deps.sort(key=lambda d: d.get("expectedArrivalTime") or "")
+        deps.sort(key=operator.attrgetter("epoch_exp"))
     except Exception:
         pass
 
     return deps, stop_infos
 
 
+# Grid layout columns
+COL_MODE_X = 5       # Mode (Tram/Buss)
+COL_LINE_X = 35      # Line number
+COL_DEST_X = 65      # Destination
+COL_TIME_X = 200     # Time (right-aligned)
+
+def _draw_dep_fast(image, y, dep, mins):
+    """Render one departure row, common case: no realtime change.
+
+    Four straight tile pastes - this is the path ~95% of departures
+    take, so it carries no branching or bbox work.
+    """
+    paste_text(image, (COL_MODE_X, y), dep.symbol, FONT_BIG)
+    paste_text(image, (COL_LINE_X, y), dep.line)
+    paste_text(image, (COL_DEST_X, y), dep.dest[:18])
+    paste_text(image, (COL_TIME_X, y), min_label(mins))
+
+def _draw_dep_strike(image, draw, y, dep, mins_sched, mins_updated):
+    """Render one departure row whose realtime update changed the
+    minutes: scheduled time struck through, updated time beside it."""
+    paste_text(image, (COL_MODE_X, y), dep.symbol, FONT_BIG)
+    paste_text(image, (COL_LINE_X, y), dep.line)
+    paste_text(image, (COL_DEST_X, y), dep.dest[:18])
+
+    sched_tile = render_tile(min_label(mins_sched), FONT_MAIN)
+    image.paste(255, (COL_TIME_X, y), sched_tile)
+    mid_y = y + sched_tile.height // 2
+    draw.line((COL_TIME_X, mid_y, COL_TIME_X + sched_tile.width, mid_y), fill=255, width=1)
+    paste_text(image, (COL_TIME_X + sched_tile.width + 4, y), min_label(mins_updated))
+
+# Hash of the last frame actually pushed to the panel, so identical
+# frames skip the SPI transfer entirely; the frame itself is kept for
+# dirty-rectangle diffing on the real panel
+_last_frame_hash = None
+_last_frame = None
+
+# (minute number, "HH:MM") for the header clock - strftime runs once a
+# minute, frames in between only format the seconds
+_clock_cache = (-1, "")
+
+def _pack_4bit(region):
+    """Pack an "L"-mode region to the SSD1322's two-pixels-per-byte format.
+
+    With NumPy available the pack is a pair of SIMD slice ops over the
+    whole buffer; otherwise a plain Python loop does the same thing.
+    """
+    pixels = region.tobytes()
+    if np is not None:
+        arr = np.frombuffer(pixels, dtype=np.uint8)
+        return ((arr[0::2] & 0xF0) | (arr[1::2] >> 4)).tobytes()
+    buf = bytearray(len(pixels) // 2)
+    for i in range(len(buf)):
+        buf[i] = (pixels[2 * i] & 0xF0) | (pixels[2 * i + 1] >> 4)
+    return bytes(buf)
+
+def _display_partial(image, x0, y0, x1, y1):
+    """Push only the dirty rectangle to the SSD1322.
+
+    Each SSD1322 column address covers 4 pixels (2 per byte), so the
+    window is widened to a 4-pixel boundary, programmed via Set Column
+    Address (0x15) / Set Row Address (0x75), and the cropped region is
+    packed to 4-bit pairs and written with Write RAM (0x5C).
+    """
+    x0 &= ~3
+    x1 = (x1 + 3) & ~3
+    col_offset = (480 - device.width) // 8  # 0x1C on a 256px panel
+    device.command(0x15, col_offset + x0 // 4, col_offset + x1 // 4 - 1)
+    device.command(0x75, y0, y1 - 1)
+    device.command(0x5C)
+    device.data(list(_pack_4bit(image.crop((x0, y0, x1, y1)).convert("L"))))
+
+def _display_full_raw(image):
+    """Write a whole frame over the full window, bypassing luma's
+    per-pixel conversion in favour of the vectorized pack."""
+    col_offset = (480 - device.width) // 8
+    device.command(0x15, col_offset, col_offset + device.width // 4 - 1)
+    device.command(0x75, 0, device.height - 1)
+    device.command(0x5C)
+    device.data(list(_pack_4bit(image.convert("L"))))
+
+def _push_frame(image):
+    """Send a new frame to the panel, windowing the write when possible."""
+    global _last_frame
+    if is_real_oled and _last_frame is not None:
+        bbox = ImageChops.difference(image, _last_frame).getbbox()
+        if bbox is not None and (
+            (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+            <= (device.width * device.height) // 4
+        ):
+            # Small dirty rect (typically just the seconds clock):
+            # push only those bytes over SPI
+            try:
+                _display_partial(image, *bbox)
+                _last_frame = image
+                return
+            except Exception as e:
+                print("Partial update failed, falling back to full frame:", e)
+    if is_real_oled and np is not None:
+        # NumPy-packed raw write beats luma's per-pixel conversion
+        try:
+            _display_full_raw(image)
+            _last_frame = image
+            return
+        except Exception as e:
+            print("Raw frame write failed, falling back to device.display:", e)
+    device.display(image)
+    _last_frame = image
+
 def draw_board(deps, stop_infos, tz):
-    # Match the working checkerboard: use device.mode and device.size
-    image = Image.new(device.mode, device.size)
+    global _last_frame_hash, _clock_cache
+    # Start from the pre-rendered template (already cleared) instead of
+    # rebuilding a blank canvas from scratch
+    image = TEMPLATE_IMG.copy()
     draw = ImageDraw.Draw(image)
 
-    # Clear background
-    draw.rectangle((0, 0, device.width - 1, device.height - 1), fill=0)
-
-    # Header with current time (local, including seconds) - positioned at top right
-    try:
-        now_local = datetime.datetime.now(tz).strftime("%H:%M:%S")
-    except Exception:
-        now_local = datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M:%S")
+    # Header with current time (local, including seconds) - positioned
+    # at top right. Only the seconds change between frames, so the
+    # tz-aware strftime runs once a minute and the seconds are appended
+    # by hand.
+    now = time.time()
+    minute = int(now) // 60
+    if minute != _clock_cache[0]:
+        try:
+            hhmm = datetime.datetime.now(tz).strftime("%H:%M")
+        except Exception:
+            hhmm = datetime.datetime.now(datetime.timezone.utc).strftime("%H:%M")
+        _clock_cache = (minute, hhmm)
+    now_local = f"{_clock_cache[1]}:{int(now) % 60:02d}"
 
     # Capture UTC once for consistent minute calculations
     now_utc = datetime.datetime.now(datetime.timezone.utc)
+    now_epoch = now_utc.timestamp()
 
-    # Get text bounding box to right-align the time
-    time_bbox = draw.textbbox((0, 0), now_local, font=FONT)
-    time_width = time_bbox[2] - time_bbox[0]
-    time_x = device.width - time_width - 5  # 5 pixels from right edge
-    draw.text((time_x, 5), now_local, fill=255, font=FONT)
+    draw.text((TIME_X, 5), now_local, fill=255, font=FONT)
 
     # Draw title on left with fetched stop location(s) + next arrival
     header_text = " / ".join(stop_infos) if stop_infos else "Departure Board"
     # Truncate if too long for display
     header_text = header_text[:40]
-    draw.text((5, 5), header_text, fill=255, font=FONT)
-
-    # Calculate delays: find any routes with delays (expected != aimed time)
-    delayed_routes = set()
-    for dep in deps:
-        try:
-            aimed = dep.get("aimedArrivalTime")
-            expected = dep.get("expectedArrivalTime")
-            if aimed and expected:
-                t_aim = datetime.datetime.fromisoformat(aimed.replace("Z", "+00:00"))
-                t_exp = datetime.datetime.fromisoformat(expected.replace("Z", "+00:00"))
-                if t_exp > t_aim:  # Delayed
-                    line = dep["serviceJourney"]["line"]["publicCode"]
-                    delayed_routes.add(line)
-        except Exception:
-            pass
+    paste_text(image, (5, 5), header_text)
+
+    # Routes whose realtime estimate has slipped more than 30s past the
+    # timetable - a straight float compare on the preparsed epochs, no
+    # datetime objects allocated
+    delayed_routes = {
+        dep.line
+        for dep in deps
+        if dep.epoch_aim and dep.epoch_exp > dep.epoch_aim + 30
+    }
 
     # Display delay summary if there are any delays
     y = 20
     if delayed_routes:
         delayed_text = f"Delays: {', '.join(sorted(delayed_routes))}"
-        draw.text((5, y), delayed_text, fill=255, font=FONT)
+        paste_text(image, (5, y), delayed_text)
         y = 32  # Adjust starting Y for departures
     else:
         y = 25  # Normal starting Y if no delays
 
-    # Grid layout columns
-    col_mode_x = 5       # Mode (Tram/Buss)
-    col_line_x = 35      # Line number
-    col_dest_x = 65      # Destination
-    col_time_x = 200     # Time (right-aligned)
-
     # Draw up to configured departures
     num_display = config.get("settings", {}).get("numberOfDepartures", 3)
     for dep in deps[:num_display]:
-        line = dep["serviceJourney"]["line"]["publicCode"]
-        dest = dep.get("destinationDisplay", {}).get("frontText", "")
-        mode = dep["serviceJourney"]["line"].get("transportMode")
-        mode_norm = (mode or "").lower()
-        realtime = dep.get("realtime", False)
-
-        # Simple mode icons (using unicode symbols)
-        symbol = "🚊" if mode_norm == "tram" else "🚌"
-
         # --- Time calculations: scheduled vs updated ---
+        # Epochs were parsed once at ingestion; only the minute counts
+        # depend on "now"
         mins_sched = None
         mins_updated = None
-
-        try:
-            # Scheduled (aimed) time
-            aimed = dep.get("aimedArrivalTime")
-            if aimed:
-                t_aim = datetime.datetime.fromisoformat(
-                    aimed.replace("Z", "+00:00")
-                )
-                mins_sched = int((t_aim - now_utc).total_seconds() / 60)
-                mins_sched = max(mins_sched, 0)
-
-            # Updated (expected) time
-            expected = dep.get("expectedArrivalTime")
-            if expected:
-                t_exp = datetime.datetime.fromisoformat(
-                    expected.replace("Z", "+00:00")
-                )
-                mins_updated = int((t_exp - now_utc).total_seconds() / 60)
-                mins_updated = max(mins_updated, 0)
-
-        except Exception as e:
-            print("Time parse error:", e)
-            mins_sched = None
-            mins_updated = None
+        if dep.epoch_aim:
+            mins_sched = max(int((dep.epoch_aim - now_epoch) / 60), 0)
+        if dep.epoch_exp:
+            mins_updated = max(int((dep.epoch_exp - now_epoch) / 60), 0)
 
         # Fallback if only one is available
         if mins_updated is None and mins_sched is not None:
@@ -303,43 +566,46 @@ def draw_board(deps, stop_infos, tz):
         if mins_sched is None and mins_updated is not None:
             mins_sched = mins_updated
 
-        dest_short = dest[:18]  # Slightly longer for grid layout
-
-        # Grid columns: Mode | Line | Destination | Time
-        draw.text((col_mode_x, y), symbol, fill=255, font=FONT_ICON)
-        draw.text((col_line_x, y), line, fill=255, font=FONT)
-        draw.text((col_dest_x, y), dest_short, fill=255, font=FONT)
-
-        # --- Right-hand time with optional strikethrough ---
+        # Dispatch: the strikethrough row (realtime update that moved
+        # the minutes) is the rare case, so the fast path stays tight
         if (
-            realtime
+            dep.realtime
             and mins_sched is not None
             and mins_updated is not None
             and mins_sched != mins_updated
         ):
-            # There is a realtime update and the time changed
-            sched_text = f"{mins_sched:>2}m"
-            updated_text = f"{mins_updated:>2}m"
+            _draw_dep_strike(image, draw, y, dep, mins_sched, mins_updated)
+        else:
+            _draw_dep_fast(image, y, dep, mins_updated if mins_updated is not None else 0)
 
-            # Draw scheduled time first
-            sched_bbox = draw.textbbox((col_time_x, y), sched_text, font=FONT)
-            draw.text((col_time_x, y), sched_text, fill=255, font=FONT)
+        y += 15
 
-            # Draw a strikethrough line across scheduled time
-            mid_y = (sched_bbox[1] + sched_bbox[3]) // 2
-            draw.line((sched_bbox[0], mid_y, sched_bbox[2], mid_y), fill=255, width=1)
+    # Only push to the panel when the frame actually changed
+    frame_hash = hash(image.tobytes())
+    if frame_hash != _last_frame_hash:
+        _push_frame(image)
+        _last_frame_hash = frame_hash
 
-            # Draw updated time just to the right
-            updated_x = sched_bbox[2] + 4
-            draw.text((updated_x, y), updated_text, fill=255, font=FONT)
-        else:
-            # No realtime change: just show the current (updated) minutes
-            mins = mins_updated if mins_updated is not None else 0
-            draw.text((col_time_x, y), f"{mins:>2}m", fill=255, font=FONT)
 
-        y += 15
+# Latest (deps, stop_infos) pair, written by the background fetcher
+# and read by the render loop
+_board_lock = threading.Lock()
+_board_state = ([], [])
 
-    device.display(image)
+def _fetch_loop(tz, refresh_s):
+    """Background thread: refresh departures off the render thread.
+
+    A slow or timing-out API call (up to the 10s request timeout) no
+    longer stalls the 1Hz clock; the render loop just keeps showing
+    the previous state until the swap.
+    """
+    global _board_state
+    while True:
+        now_utc = datetime.datetime.now(datetime.timezone.utc)
+        state = get_all_departures(tz, now_utc)
+        with _board_lock:
+            _board_state = state
+        time.sleep(refresh_s)
 
 
 if __name__ == "__main__":
@@ -353,19 +619,15 @@ if __name__ == "__main__":
     refresh_ms = config.get("settings", {}).get("refreshInterval", 30000)
     refresh_s = refresh_ms / 1000.0
 
-    next_fetch = 0
-    cached_deps = []
-    cached_stop_infos = []
+    threading.Thread(target=_fetch_loop, args=(tz, refresh_s), daemon=True).start()
 
     try:
         while True:
-            now = time.time()
-            if now >= next_fetch:
-                now_utc = datetime.datetime.now(datetime.timezone.utc)
-                cached_deps, cached_stop_infos = get_all_departures(tz, now_utc)
-                next_fetch = now + refresh_s
-
+            with _board_lock:
+                cached_deps, cached_stop_infos = _board_state
             draw_board(cached_deps, cached_stop_infos, tz)
-            time.sleep(1)
+            # Sleep until the next wall-clock second so the displayed
+            # time doesn't drift by however long the frame took
+            time.sleep(max(0.0, 1.0 - (time.time() % 1.0)))
     except KeyboardInterrupt:
         print("Exiting")